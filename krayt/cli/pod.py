@@ -1,13 +1,12 @@
-import iterfzf
-from krayt.templates import env
-from kubernetes.stream import stream
-from kubernetes import client, config
+from __future__ import annotations
+
+from functools import lru_cache
+import hashlib
 import logging
 import os
 import time
 import typer
-from typing import Any, List, Optional
-import yaml
+from typing import TYPE_CHECKING, Any, List, Optional
 from krayt.__about__ import __version__
 import sys
 import tty
@@ -16,72 +15,118 @@ import select
 import signal
 import json
 
+if TYPE_CHECKING:
+    # Annotations only; the runtime import stays deferred for startup speed
+    from kubernetes import client
+
 
 logging.basicConfig(level=logging.WARNING)
 
 app = typer.Typer()
 
 
+@lru_cache(maxsize=1)
+def _api_client():
+    """Parse kubeconfig once and share a single ApiClient (and its
+    connection pool) across every command in the process."""
+    from kubernetes import client, config
+
+    config.load_kube_config()
+    # The default urllib3 pool caps out at 4 connections; widen it so
+    # concurrent requests don't queue at the HTTP layer
+    cfg = client.Configuration.get_default_copy()
+    cfg.connection_pool_maxsize = 16
+    return client.ApiClient(configuration=cfg)
+
+
+@lru_cache(maxsize=1)
+def _core_v1():
+    from kubernetes import client
+
+    return client.CoreV1Api(_api_client())
+
+
+@lru_cache(maxsize=1)
+def _batch_v1():
+    from kubernetes import client
+
+    return client.BatchV1Api(_api_client())
+
+
 def clean_dict(d: dict[str, Any]) -> dict[str, Any]:
-    """Remove None values and empty dicts from a dictionary recursively."""
+    """Remove None values and empty dicts from a dictionary recursively.
+
+    Single post-order pass: each nested dict is cleaned exactly once and
+    filtered by the cleaned result.
+    """
     if not isinstance(d, dict):
         return d
-    return {
-        k: clean_dict(v)
-        for k, v in d.items()
-        if v is not None and v != {} and not (isinstance(v, dict) and not clean_dict(v))
-    }
+    out = {}
+    for k, v in d.items():
+        cv = clean_dict(v) if isinstance(v, dict) else v
+        if cv is None:
+            continue
+        if cv == {}:
+            continue
+        out[k] = cv
+    return out
+
+
+# Kubernetes-managed mounts/volumes to exclude; tuples so startswith checks
+# several prefixes in one call if more are ever added
+_SKIP_MOUNT_PREFIXES = ("/var/run/secrets/kubernetes.io/",)
+_SKIP_VOLUME_PREFIXES = ("kube-api-access-",)
 
 
 def format_volume_mount(vm: client.V1VolumeMount) -> dict[str, Any]:
     """Format volume mount with only relevant fields."""
     # Skip Kubernetes service account mounts
-    if vm.mount_path.startswith("/var/run/secrets/kubernetes.io/"):
+    if vm.mount_path.startswith(_SKIP_MOUNT_PREFIXES):
         return None
 
-    return clean_dict(
-        {
-            "name": vm.name,
-            "mount_path": vm.mount_path,
-            "read_only": vm.read_only if vm.read_only else None,
-        }
-    )
+    # Fixed-shape dict; no need to round-trip it through clean_dict
+    d = {"name": vm.name, "mount_path": vm.mount_path}
+    if vm.read_only:
+        d["read_only"] = True
+    return d
 
 
-def format_volume(v: client.V1Volume) -> dict[str, Any]:
-    """Format volume into a dictionary, return None if it should be skipped"""
-    # Skip Kubernetes service account volumes
-    if v.name.startswith("kube-api-access-"):
-        return None
-
-    volume_source = None
-    if v.persistent_volume_claim:
-        volume_source = {
-            "persistentVolumeClaim": {"claimName": v.persistent_volume_claim.claim_name}
-        }
-    elif v.config_map:
-        volume_source = {"configMap": {"name": v.config_map.name}}
-    elif v.secret:
-        volume_source = {"secret": {"secretName": v.secret.secret_name}}
-    elif v.host_path:  # Add support for hostPath volumes (used for device mounts)
-        volume_source = {
-            "hostPath": {
-                "path": v.host_path.path,
-                "type": v.host_path.type if v.host_path.type else None,
-            }
-        }
-    elif v.empty_dir:  # Add support for emptyDir volumes (used for /dev/shm)
-        volume_source = {
+# Supported volume source types and how to render each; first match wins.
+# hostPath covers device mounts, emptyDir covers /dev/shm.
+_VOLUME_BUILDERS = (
+    (
+        "persistent_volume_claim",
+        lambda s: {"persistentVolumeClaim": {"claimName": s.claim_name}},
+    ),
+    ("config_map", lambda s: {"configMap": {"name": s.name}}),
+    ("secret", lambda s: {"secret": {"secretName": s.secret_name}}),
+    (
+        "host_path",
+        lambda s: {"hostPath": {"path": s.path, **({"type": s.type} if s.type else {})}},
+    ),
+    (
+        "empty_dir",
+        lambda s: {
             "emptyDir": {
-                "medium": v.empty_dir.medium if v.empty_dir.medium else None,
-                "sizeLimit": v.empty_dir.size_limit if v.empty_dir.size_limit else None,
+                **({"medium": s.medium} if s.medium else {}),
+                **({"sizeLimit": s.size_limit} if s.size_limit else {}),
             }
-        }
+        },
+    ),
+)
 
-    if not volume_source:
+
+def format_volume(v: client.V1Volume) -> dict[str, Any]:
+    """Format volume into a dictionary, return None if it should be skipped"""
+    # Skip Kubernetes service account volumes
+    if v.name.startswith(_SKIP_VOLUME_PREFIXES):
         return None
 
-    return clean_dict({"name": v.name, **volume_source})
+    for attr, build in _VOLUME_BUILDERS:
+        source = getattr(v, attr)
+        if source:
+            return {"name": v.name, **build(source)}
+    return None
 
 
 def fuzzy_select(items):
@@ -93,57 +138,81 @@ def fuzzy_select(items):
     if len(items) == 1:
         return items[0]
 
-    # Format items for display
-    formatted_items = [f"{name} ({namespace})" for name, namespace in items]
+    # Format items for display, keyed so the selection maps straight back
+    # to its (name, namespace) pair instead of being re-parsed
+    index = {f"{name} ({namespace})": (name, namespace) for name, namespace in items}
 
     # Use fzf for selection
     try:
+        import iterfzf
+
         # selected = inquirer.fuzzy(
         #     message="Select a pod to clone:", choices=formatted_items
         # ).execute()
 
         selected = iterfzf.iterfzf(
-            formatted_items,
+            index,
             prompt="Select a pod to clone:",
             # preview='''kubectl describe pod "$(echo {} | awk -F'[(|)]' '{gsub(/\x1b\[[0-9;]*m/, "", $1); print $1}' | xargs)" -n "$(echo {} | awk -F'[(|)]' '{gsub(/\x1b\[[0-9;]*m/, "", $2); print $2}' | xargs)"''',
         )
         if not selected:
             return None, None
 
-        # Parse selection back into name and namespace
-        # Example: "pod-name (namespace)" -> ("pod-name", "namespace")
-        name = selected.split(" (")[0]
-        namespace = selected.split(" (")[1][:-1]
-        return name, namespace
+        return index[selected]
 
     except Exception as e:
         typer.echo(f"Error during selection: {e}")
         return None, None
 
 
+# Ask the apiserver for object metadata only; full specs and statuses
+# never cross the wire on the listing path
+_PARTIAL_METADATA_ACCEPT = (
+    "application/json;as=PartialObjectMetadataList;g=meta.k8s.io;v=v1,application/json"
+)
+
+
+def _list_pod_metadata(namespace, label_selector, _continue=None, limit=500):
+    """List one page of pods as PartialObjectMetadata dicts."""
+    path = f"/api/v1/namespaces/{namespace}/pods" if namespace else "/api/v1/pods"
+    query_params = [("labelSelector", label_selector), ("limit", limit)]
+    if _continue:
+        query_params.append(("continue", _continue))
+    return _api_client().call_api(
+        path,
+        "GET",
+        query_params=query_params,
+        header_params={"Accept": _PARTIAL_METADATA_ACCEPT},
+        auth_settings=["BearerToken"],
+        response_type=object,
+        _return_http_data_only=True,
+    )
+
+
 def get_pods(
     namespace=None,
     label_selector: str = "app=krayt",
 ):
     """Get list of pods in the specified namespace or all namespaces"""
-    try:
-        config.load_kube_config()
-        api = client.CoreV1Api()
-        if namespace:
-            pods = api.list_namespaced_pod(
-                namespace=namespace,
-                label_selector=label_selector,
-            )
-        else:
-            pods = api.list_pod_for_all_namespaces(
-                label_selector=label_selector,
-            )
+    from kubernetes import client
 
-        # Convert to list of (name, namespace) tuples
+    try:
+        # Page through the metadata-only list so large clusters don't
+        # force the apiserver to materialize every pod in one response
         pod_list = []
-        for pod in pods.items:
-            if pod.metadata.namespace not in PROTECTED_NAMESPACES:
-                pod_list.append((pod.metadata.name, pod.metadata.namespace))
+        _continue = None
+        while True:
+            pods = _list_pod_metadata(namespace, label_selector, _continue)
+
+            # Convert to list of (name, namespace) tuples
+            for item in pods["items"]:
+                metadata = item["metadata"]
+                if metadata["namespace"] not in PROTECTED_NAMESPACES:
+                    pod_list.append((metadata["name"], metadata["namespace"]))
+
+            _continue = pods["metadata"].get("continue")
+            if not _continue:
+                break
         return pod_list
 
     except client.rest.ApiException as e:
@@ -155,17 +224,37 @@ def get_namespaces(
     namespace=None,
     label_selector: str = "app=krayt",
 ):
-    config.load_kube_config()
-    api = client.CoreV1Api()
+    api = _core_v1()
 
     all_namespaces = [n.metadata.name for n in api.list_namespace().items]
     return all_namespaces
 
 
 def get_pod_spec(pod_name, namespace):
-    config.load_kube_config()
-    v1 = client.CoreV1Api()
-    return v1.read_namespaced_pod(pod_name, namespace)
+    return _core_v1().read_namespaced_pod(pod_name, namespace)
+
+
+@lru_cache(maxsize=1)
+def _special_volume_builders():
+    """Replacement sources for well-known device and cache volumes."""
+    from kubernetes import client
+
+    return {
+        "cache-volume": lambda: client.V1Volume(
+            name="cache-volume",
+            empty_dir=client.V1EmptyDirVolumeSource(medium="Memory"),
+        ),
+        "coral-device": lambda: client.V1Volume(
+            name="coral-device",
+            host_path=client.V1HostPathVolumeSource(
+                path="/dev/apex_0", type="CharDevice"
+            ),
+        ),
+        "qsv-device": lambda: client.V1Volume(
+            name="qsv-device",
+            host_path=client.V1HostPathVolumeSource(path="/dev/dri", type="Directory"),
+        ),
+    }
 
 
 def get_pod_volumes_and_mounts(pod_spec):
@@ -175,67 +264,51 @@ def get_pod_volumes_and_mounts(pod_spec):
         if container.volume_mounts:
             volume_mounts.extend(container.volume_mounts)
 
-    # Filter out None values from volume mounts
-    volume_mounts = [vm for vm in volume_mounts if format_volume_mount(vm)]
+    # Format once and keep the result; skipped mounts drop out here
+    volume_mounts = [
+        fvm for vm in volume_mounts if (fvm := format_volume_mount(vm)) is not None
+    ]
 
-    # Get all volumes, including device mounts
+    # Get all volumes, swapping in the special device/cache sources by name
     volumes = []
     if pod_spec.spec.volumes:
+        special = _special_volume_builders()
         for v in pod_spec.spec.volumes:
-            # Handle device mounts
-            if v.name in ["cache-volume"]:
-                volumes.append(
-                    client.V1Volume(
-                        name=v.name,
-                        empty_dir=client.V1EmptyDirVolumeSource(medium="Memory"),
-                    )
-                )
-            elif v.name in ["coral-device"]:
-                volumes.append(
-                    client.V1Volume(
-                        name=v.name,
-                        host_path=client.V1HostPathVolumeSource(
-                            path="/dev/apex_0", type="CharDevice"
-                        ),
-                    )
-                )
-            elif v.name in ["qsv-device"]:
-                volumes.append(
-                    client.V1Volume(
-                        name=v.name,
-                        host_path=client.V1HostPathVolumeSource(
-                            path="/dev/dri", type="Directory"
-                        ),
-                    )
-                )
-            else:
-                volumes.append(v)
+            builder = special.get(v.name)
+            volumes.append(builder() if builder else v)
 
-    # Filter out None values from volumes
-    volumes = [v for v in volumes if format_volume(v)]
+    # Drop service-account volumes here without formatting; volumes with no
+    # recognized source fall out in create_inspector_job's single
+    # format_volume pass
+    volumes = [v for v in volumes if not v.name.startswith(_SKIP_VOLUME_PREFIXES)]
 
     return volume_mounts, volumes
 
 
+# Proxy environment variables forwarded from the host into inspector pods
+PROXY_VARS = (
+    "HTTP_PROXY",
+    "HTTPS_PROXY",
+    "NO_PROXY",
+    "http_proxy",
+    "https_proxy",
+    "no_proxy",
+)
+
+
 def get_env_vars_and_secret_volumes(api, namespace: str):
     """Get environment variables and secret volumes for the inspector pod"""
-    env_vars = []
+    from kubernetes import client
+
     volumes = []
 
     # Add proxy environment variables if they exist in the host environment
-    proxy_vars = [
-        "HTTP_PROXY",
-        "HTTPS_PROXY",
-        "NO_PROXY",
-        "http_proxy",
-        "https_proxy",
-        "no_proxy",
+    env_vars = [
+        {"name": var, "value": value}
+        for var in PROXY_VARS
+        if (value := os.environ.get(var)) is not None
     ]
 
-    for var in proxy_vars:
-        if var in os.environ:
-            env_vars.append({"name": var, "value": os.environ[var]})
-
     # Look for secret volumes in the namespace
     try:
         secrets = api.list_namespaced_secret(namespace)
@@ -264,6 +337,26 @@ def get_env_vars_and_secret_volumes(api, namespace: str):
     return env_vars, volumes
 
 
+@lru_cache(maxsize=16)
+def _render_inspector_command(volumes: tuple, additional_packages: Optional[tuple]):
+    """Render base.sh once per distinct (volumes, packages) combination.
+
+    Template compilation is already cached by get_template; this also
+    reuses the rendered script when several jobs share the same inputs.
+    """
+    from krayt.templates import get_template
+
+    return get_template("base.sh").render(
+        volumes=volumes,
+        pvcs=None,
+        additional_packages=list(additional_packages) if additional_packages else None,
+        pre_init_scripts=None,
+        post_init_scripts=None,
+        pre_init_hooks=None,
+        post_init_hooks=None,
+    )
+
+
 def create_inspector_job(
     api,
     namespace: str,
@@ -278,53 +371,82 @@ def create_inspector_job(
     pre_init_hooks: Optional[List[str]] = None,
     post_init_hooks: Optional[List[str]] = None,
 ):
-    timestamp = int(time.time())
-    job_name = f"{pod_name}-krayt-{timestamp}"
+    from kubernetes import client
+
+    # Deterministic suffix so re-running against the same pod produces the
+    # same manifest and `kubectl apply` stays a no-op
+    suffix = hashlib.blake2b(
+        f"{namespace}:{pod_name}".encode(), digest_size=4
+    ).hexdigest()
+    job_name = f"{pod_name}-krayt-{suffix}"
 
     env_vars, secret_volumes = get_env_vars_and_secret_volumes(api, namespace)
-    volumes.extend(secret_volumes)
 
-    secret_mounts = [
-        client.V1VolumeMount(
-            name=vol.name,
-            mount_path=f"/mnt/secrets/{vol.secret.secret_name}",
-            read_only=True,
+    # volume_mounts already arrive formatted from get_pod_volumes_and_mounts
+    formatted_mounts = [client.V1VolumeMount(**vm) for vm in volume_mounts]
+
+    # One pass over secret volumes registers the volume and its mount together
+    for vol in secret_volumes:
+        volumes.append(vol)
+        formatted_mounts.append(
+            client.V1VolumeMount(
+                name=vol.name,
+                mount_path=f"/mnt/secrets/{vol.secret.secret_name}",
+                read_only=True,
+            )
         )
-        for vol in secret_volumes
-    ]
-
-    formatted_mounts = [format_volume_mount(vm) for vm in volume_mounts]
-    formatted_mounts = [client.V1VolumeMount(**vm) for vm in formatted_mounts if vm]
-    formatted_mounts.extend(secret_mounts)
 
     pvc_info = [
-        f"{v.name}:{v.persistent_volume_claim.claim_name}"
+        f"{v.name}:{pvc.claim_name}"
         for v in volumes
-        if hasattr(v, "persistent_volume_claim") and v.persistent_volume_claim
+        if (pvc := getattr(v, "persistent_volume_claim", None))
     ]
 
-    template = env.get_template("base.sh")
-    command = template.render(
-        volumes=volumes,
-        pvcs=None,
-        additional_packages=additional_packages,
-        pre_init_scripts=None,
-        post_init_scripts=None,
-        pre_init_hooks=None,
-        post_init_hooks=None,
+    # The templates only ever stringify the volumes, so a tuple of their
+    # string forms is an equivalent, hashable cache key
+    command = _render_inspector_command(
+        tuple(str(v) for v in volumes),
+        tuple(additional_packages) if additional_packages else None,
+    )
+
+    # Ship the startup script as a ConfigMap-mounted file instead of
+    # inlining it into the container command; the Job spec stays small and
+    # the script lands in the pod as a real file
+    config_map = client.V1ConfigMap(
+        api_version="v1",
+        kind="ConfigMap",
+        metadata=client.V1ObjectMeta(
+            name=job_name,
+            namespace=namespace,
+            labels={"app": "krayt"},
+        ),
+        data={"init.sh": command},
+    )
+
+    formatted_mounts.append(
+        client.V1VolumeMount(
+            name="krayt-init",
+            mount_path="/etc/krayt-init",
+            read_only=True,
+        )
     )
 
     container = client.V1Container(
         name="inspector",
         image=image,
-        command=["sh", "-c", command],
+        command=["sh", "/etc/krayt-init/init.sh"],
         env=env_vars,
         volume_mounts=formatted_mounts,
     )
 
+    formatted_volumes = [fv for v in volumes if (fv := format_volume(v)) is not None]
+    formatted_volumes.append(
+        {"name": "krayt-init", "configMap": {"name": job_name, "defaultMode": 0o755}}
+    )
+
     spec = client.V1PodSpec(
         containers=[container],
-        volumes=[format_volume(v) for v in volumes if format_volume(v)],
+        volumes=formatted_volumes,
         restart_policy="Never",
         image_pull_secrets=[client.V1LocalObjectReference(name=imagepullsecret)]
         if imagepullsecret
@@ -352,7 +474,7 @@ def create_inspector_job(
         spec=job_spec,
     )
 
-    return job
+    return config_map, job
 
 
 PROTECTED_NAMESPACES = {
@@ -374,17 +496,7 @@ PROTECTED_NAMESPACES = {
 
 def setup_environment():
     """Set up the environment with proxy settings and other configurations"""
-    # Load environment variables for proxies
-    proxy_vars = [
-        "HTTP_PROXY",
-        "HTTPS_PROXY",
-        "NO_PROXY",
-        "http_proxy",
-        "https_proxy",
-        "no_proxy",
-    ]
-
-    for var in proxy_vars:
+    for var in PROXY_VARS:
         if var in os.environ:
             # Make both upper and lower case versions available
             os.environ[var.upper()] = os.environ[var]
@@ -398,8 +510,9 @@ def version_callback(value: bool):
 
 
 def get_pod(namespace: Optional[str] = None):
-    config.load_kube_config()
-    batch_api = client.BatchV1Api()
+    from kubernetes import client
+
+    batch_api = _batch_v1()
 
     try:
         if namespace:
@@ -411,19 +524,30 @@ def get_pod(namespace: Optional[str] = None):
             logging.debug("Listing jobs in all namespaces")
             jobs = batch_api.list_job_for_all_namespaces(label_selector="app=krayt")
 
-        running_inspectors = []
-        for job in jobs.items:
-            # Get the pod for this job
-            v1 = client.CoreV1Api()
+        # One pod list covers every job; cross-reference via the job-name
+        # label instead of issuing a list call per job
+        job_names = {job.metadata.name for job in jobs.items}
+
+        # Let the apiserver filter to running pods so non-running inspector
+        # pods never cross the wire
+        v1 = _core_v1()
+        if namespace:
             pods = v1.list_namespaced_pod(
-                namespace=job.metadata.namespace,
-                label_selector=f"job-name={job.metadata.name}",
+                namespace=namespace,
+                label_selector="app=krayt",
+                field_selector="status.phase=Running",
+            )
+        else:
+            pods = v1.list_pod_for_all_namespaces(
+                label_selector="app=krayt",
+                field_selector="status.phase=Running",
             )
-            for pod in pods.items:
-                if pod.status.phase == "Running":
-                    running_inspectors.append(
-                        (pod.metadata.name, pod.metadata.namespace)
-                    )
+
+        running_inspectors = [
+            (pod.metadata.name, pod.metadata.namespace)
+            for pod in pods.items
+            if (pod.metadata.labels or {}).get("job-name") in job_names
+        ]
 
         if not running_inspectors:
             typer.echo("No running inspector pods found.")
@@ -445,17 +569,17 @@ def get_pod(namespace: Optional[str] = None):
     return pod_name, pod_namespace
 
 
-def interactive_exec(pod_name: str, namespace: str):
+def interactive_exec(pod_name: str, namespace: str, shell: str = "/bin/bash"):
+    from kubernetes.stream import stream
+
     # Load kubeconfig from local context (or use load_incluster_config if running inside the cluster)
     print(f"Connecting to pod {pod_name} in namespace {namespace}...")
     try:
-        config.load_kube_config()
+        core_v1 = _core_v1()
     except Exception as e:
         print(f"Error loading kubeconfig: {e}", file=sys.stderr)
         return
-
-    core_v1 = client.CoreV1Api()
-    command = ["/bin/bash", "-l"]
+    command = [shell, "-l"]
     resp = None
 
     # Save the current terminal settings
@@ -579,13 +703,13 @@ def exec(
     Enter the Krayt dragon's lair! Connect to a running inspector pod.
     If multiple inspectors are found, you'll get to choose which one to explore.
     """
-    config.load_kube_config()  # or config.load_incluster_config() if running inside a pod
-    client.CoreV1Api()
-
     pod_name, pod_namespace = get_pod(namespace)
 
-    try:
-        pod_name, pod_namespace = get_pod(namespace)
+    if sys.stdin.isatty():
+        # Reuse the already-authenticated API client instead of paying
+        # kubectl's startup and TLS handshake
+        interactive_exec(pod_name, pod_namespace, shell=shell)
+    else:
         exec_command = [
             "kubectl",
             "exec",
@@ -599,10 +723,6 @@ def exec(
         ]
 
         os.execvp("kubectl", exec_command)
-    except Exception as e:
-        print(f"Error executing command with kubectl trying python api: {e}")
-
-        interactive_exec(pod_name, pod_namespace)
 
 
 @app.command()
@@ -657,8 +777,9 @@ def clean(
     Clean up after your hunt! Remove all Krayt inspector jobs.
     Use --yes/-y to skip confirmation and clean up immediately.
     """
-    config.load_kube_config()
-    batch_api = client.BatchV1Api()
+    from kubernetes import client
+
+    batch_api = _batch_v1()
 
     try:
         if namespace:
@@ -673,47 +794,49 @@ def clean(
             logging.debug("Listing jobs in all namespaces")
             jobs = batch_api.list_job_for_all_namespaces(label_selector="app=krayt")
 
-        # Filter out jobs in protected namespaces
-        jobs.items = [
+        # Filter out jobs in protected namespaces without mutating the
+        # response object
+        job_items = [
             job
             for job in jobs.items
             if job.metadata.namespace not in PROTECTED_NAMESPACES
         ]
 
-        if not jobs.items:
+        if not job_items:
             typer.echo("No Krayt inspector jobs found.")
             return
 
         # Show confirmation prompt
         if not yes:
             job_list = "\n".join(
-                f"  {job.metadata.namespace}/{job.metadata.name}" for job in jobs.items
+                f"  {job.metadata.namespace}/{job.metadata.name}" for job in job_items
             )
             typer.echo(f"The following inspector jobs will be deleted:\n{job_list}")
             if not typer.confirm("Are you sure you want to continue?"):
                 typer.echo("Operation cancelled.")
                 return
 
-        # Delete each job
-        for job in jobs.items:
+        # One deleteCollection per namespace instead of one call per job;
+        # the same label selector also sweeps up the init-script ConfigMaps
+        for ns in sorted({job.metadata.namespace for job in job_items}):
             try:
-                logging.debug(
-                    f"Deleting job {job.metadata.namespace}/{job.metadata.name}"
+                logging.debug(f"Deleting inspector jobs in namespace {ns}")
+                batch_api.delete_collection_namespaced_job(
+                    namespace=ns,
+                    label_selector="app=krayt",
+                    propagation_policy="Background",
                 )
-                batch_api.delete_namespaced_job(
-                    name=job.metadata.name,
-                    namespace=job.metadata.namespace,
-                    body=client.V1DeleteOptions(propagation_policy="Background"),
+                _core_v1().delete_collection_namespaced_config_map(
+                    namespace=ns,
+                    label_selector="app=krayt",
                 )
-                typer.echo(f"Deleted job: {job.metadata.namespace}/{job.metadata.name}")
             except client.exceptions.ApiException as e:
-                logging.error(
-                    f"Failed to delete job {job.metadata.namespace}/{job.metadata.name}: {e}"
-                )
-                typer.echo(
-                    f"Failed to delete job {job.metadata.namespace}/{job.metadata.name}: {e}",
-                    err=True,
-                )
+                logging.error(f"Failed to delete jobs in namespace {ns}: {e}")
+                typer.echo(f"Failed to delete jobs in namespace {ns}: {e}", err=True)
+                continue
+            for job in job_items:
+                if job.metadata.namespace == ns:
+                    typer.echo(f"Deleted job: {ns}/{job.metadata.name}")
 
     except client.exceptions.ApiException as e:
         logging.error(f"Failed to list jobs: {e}")
@@ -784,12 +907,25 @@ def create(
         "--apply",
         help="Automatically apply the changes instead of just echoing them.",
     ),
+    output: str = typer.Option(
+        "yaml",
+        "--output",
+        "-o",
+        help="Manifest output format when echoing: yaml or json.",
+    ),
 ):
     """
     Krack open a Krayt dragon! Create an inspector pod to explore what's inside your volumes.
     If namespace is not specified, will search for pods across all namespaces.
     The inspector will be created in the same namespace as the selected pod.
     """
+    import yaml
+
+    try:
+        from yaml import CSafeDumper as SafeDumper
+    except ImportError:
+        from yaml import SafeDumper
+
     # For create, we want to list all pods, not just Krayt pods
     selected_namespace = namespace
     selected_pod = clone
@@ -797,7 +933,6 @@ def create(
     if namespace is None and clone is not None and "/" in clone:
         selected_namespace, selected_pod = clone.split("/", 1)
 
-    get_namespaces(namespace)
     pods = get_pods(namespace, label_selector="app!=krayt")
 
     if not pods:
@@ -818,8 +953,8 @@ def create(
     pod_spec = get_pod_spec(selected_pod, selected_namespace)
     volume_mounts, volumes = get_pod_volumes_and_mounts(pod_spec)
 
-    inspector_job = create_inspector_job(
-        client.CoreV1Api(),
+    config_map, inspector_job = create_inspector_job(
+        _core_v1(),
         selected_namespace,
         selected_pod,
         volume_mounts,
@@ -833,22 +968,51 @@ def create(
         post_init_hooks=post_init_hooks,
     )
 
-    # Output the job manifest
-    api_client = client.ApiClient()
-    job_dict = api_client.sanitize_for_serialization(inspector_job)
-    job_yaml = yaml.dump(job_dict, sort_keys=False)
-
     if apply:
-        batch_api = client.BatchV1Api()
-        job = batch_api.create_namespaced_job(
-            namespace=selected_namespace,
-            body=inspector_job,
-        )
+        from kubernetes import client
+
+        # Job/ConfigMap names are deterministic per pod, so a live
+        # inspector from a previous run makes these creates conflict
+        try:
+            _core_v1().create_namespaced_config_map(
+                namespace=selected_namespace,
+                body=config_map,
+            )
+            batch_api = _batch_v1()
+            job = batch_api.create_namespaced_job(
+                namespace=selected_namespace,
+                body=inspector_job,
+            )
+        except client.exceptions.ApiException as e:
+            if e.status == 409:
+                typer.echo(
+                    f"An inspector for {selected_pod} already exists in "
+                    f"{selected_namespace} — run `krayt clean` first.",
+                    err=True,
+                )
+                raise typer.Exit(1)
+            raise
         print(f"Job {job.metadata.name} created.")
         return job
+
+    # Echo the init-script ConfigMap and the job as one manifest
+    api_client = _api_client()
+    cm_dict = api_client.sanitize_for_serialization(config_map)
+    job_dict = api_client.sanitize_for_serialization(inspector_job)
+
+    # Serialize straight to stdout rather than building the manifest string
+    # in memory first
+    if output == "json":
+        # kubectl accepts a v1 List, and the C-accelerated json module is
+        # far cheaper than PyYAML for manifests this size
+        json.dump(
+            {"apiVersion": "v1", "kind": "List", "items": [cm_dict, job_dict]},
+            sys.stdout,
+            indent=2,
+        )
+        sys.stdout.write("\n")
     else:
-        # Just echo the YAML
-        typer.echo(job_yaml)
+        yaml.dump_all([cm_dict, job_dict], sys.stdout, Dumper=SafeDumper, sort_keys=False)
 
 
 @app.command()
@@ -874,6 +1038,8 @@ def logs(
     View logs from a Krayt inspector pod.
     If multiple inspectors are found, you'll get to choose which one to explore.
     """
+    from kubernetes import client
+
     pods = get_pods(namespace)
     if not pods:
         typer.echo("No pods found.")
@@ -885,8 +1051,7 @@ def logs(
         raise typer.Exit(1)
 
     try:
-        config.load_kube_config()
-        api = client.CoreV1Api()
+        api = _core_v1()
         logs = api.read_namespaced_pod_log(
             name=selected_pod,
             namespace=selected_namespace,
@@ -1,4 +1,3 @@
-from krayt.templates import env
 import typer
 from typing import List, Optional
 
@@ -7,6 +6,8 @@ app = typer.Typer()
 
 @app.command()
 def list():
+    from krayt.templates import env
+
     typer.echo("Available templates:")
     for template in env.list_templates():
         typer.echo(template)
@@ -49,7 +50,9 @@ def render(
         help="additional hooks to execute at the start of container initialization",
     ),
 ):
-    template = env.get_template(template_name)
+    from krayt.templates import get_template
+
+    template = get_template(template_name)
     rendered = template.render(
         volumes=volumes,
         pvcs=pvcs,
@@ -62,17 +65,19 @@ def render(
     print(rendered)
 
 
-# @app.command()
-# def install(
-#     additional_packages: Optional[List[str]] = typer.Option(
-#         ..., "--additional-packages", "-ap"
-#     ),
-# ):
-#     template_name = "install.sh"
-#     template = env.get_template(template_name)
-#     rendered = template.render(additional_packages=additional_packages)
-#     print(rendered)
-#
+@app.command()
+def install(
+    additional_packages: Optional[List[str]] = typer.Option(
+        None, "--additional-packages", "-ap"
+    ),
+):
+    from krayt.templates import get_template
+
+    template = get_template("install.sh")
+    rendered = template.render(additional_packages=additional_packages)
+    print(rendered)
+
+
 #
 # @app.command()
 # def motd(
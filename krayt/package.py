@@ -1,24 +1,16 @@
+from dataclasses import dataclass
+from functools import lru_cache
 from krayt.bundles import bundles
-from more_itertools import unique_everseen
-from pydantic import BaseModel, BeforeValidator
-from typing import Annotated, List, Literal, Optional, Union
-
-
-SUPPORTED_KINDS = {
-    "system",
-    "uv",
-    "installer",
-    "i",
-    "curlbash",
-    "curlsh",
-    "cargo",
-    "pipx",
-    "npm",
-    "go",
-    "gh",
-    "group",
-    "bundle",
-}
+from typing import List, Optional, Union
+
+__all__ = [
+    "DEPENDENCIES",
+    "Package",
+    "SUPPORTED_KINDS",
+    "get_install_script",
+    "parse_many",
+    "validate_kind",
+]
 
 DEPENDENCIES = {
     "uv": [
@@ -39,25 +31,46 @@ DEPENDENCIES = {
 }
 
 
+# i/installer/gh are aliases and share one template string
+_INSTALLER_TEMPLATE = "installer {v}"
+
+_CMD_TEMPLATES = {
+    "bundle": "",
+    "group": "",
+    "system": "detect_package_manager_and_install {v}",
+    "uv": "uv tool install {v}",
+    "i": _INSTALLER_TEMPLATE,
+    "installer": _INSTALLER_TEMPLATE,
+    "gh": _INSTALLER_TEMPLATE,
+    "curlsh": "curl -fsSL {v} | sh",
+    "curlbash": "curl -fsSL {v} | bash",
+    "cargo": "cargo install {v}",
+    "pipx": "pipx install {v}",
+    "npm": "npm install -g {v}",
+    "go": "go install {v}@latest",
+}
+
+# The command table is the one authoritative list of kinds
+SUPPORTED_KINDS = frozenset(_CMD_TEMPLATES)
+
+
 def validate_kind(v):
     if v not in SUPPORTED_KINDS:
         raise ValueError(
-            f"Unknown installer kind: {v}\n    Supported kinds: {SUPPORTED_KINDS}\n   "
+            f"Unknown installer kind: {v}\n    Supported kinds: {sorted(SUPPORTED_KINDS)}\n   "
         )
     return v
 
 
-class Package(BaseModel):
+@dataclass(frozen=True, slots=True)
+class Package:
     """
     Represents a package to be installed, either via system package manager
     or an alternative installer like uv, installer.sh, etc.
     """
 
-    kind: Annotated[
-        Literal[*SUPPORTED_KINDS],
-        BeforeValidator(validate_kind),
-    ] = "system"
     value: str
+    kind: str = "system"
     # dependencies: Optional[List["Package"]] = None
     pre_install_hook: Optional[str] = None
     post_install_hook: Optional[str] = None
@@ -67,11 +80,19 @@ class Package(BaseModel):
         """
         Parse a raw input string like 'uv:copier' into a Package(kind='uv', value='copier')
         """
-        if ":" in raw:
-            prefix, value = raw.split(":", 1)
-            return cls(kind=prefix.strip(), value=value.strip())
-        else:
-            return cls(kind="system", value=raw.strip())
+        return _from_raw_cached(raw)
+
+    @classmethod
+    def _from_trusted(cls, raw: str) -> "Package":
+        """
+        Parse a raw string that came from this module's own tables.
+
+        Skips kind validation; DEPENDENCIES entries are known-good literals.
+        """
+        prefix, sep, value = raw.partition(":")
+        if sep:
+            return cls(kind=prefix, value=value)
+        return cls(value=raw)
 
     # @model_validator(mode="after")
     # def validate_dependencies(self) -> Self:
@@ -99,33 +120,19 @@ class Package(BaseModel):
     def is_system(self) -> bool:
         return self.kind == "system"
 
+    @lru_cache(maxsize=None)
     def install_command(self) -> str:
         """
         Generate the bash install command snippet for this package.
+
+        Packages are frozen and shared via the from_raw cache, so the
+        formatted command is cached per instance; shared dependencies like
+        curl format their string once per process.
         """
-        cmd = ""
-        if self.kind in ["bundle", "group"]:
-            cmd = ""
-        elif self.kind == "system":
-            cmd = f"detect_package_manager_and_install {self.value}"
-        elif self.kind == "uv":
-            cmd = f"uv tool install {self.value}"
-        elif self.kind in ["i", "installer", "gh"]:
-            cmd = f"installer {self.value}"
-        elif self.kind == "curlsh":
-            cmd = f"curl -fsSL {self.value} | sh"
-        elif self.kind == "curlbash":
-            cmd = f"curl -fsSL {self.value} | bash"
-        elif self.kind == "cargo":
-            cmd = f"cargo install {self.value}"
-        elif self.kind == "pipx":
-            cmd = f"pipx install {self.value}"
-        elif self.kind == "npm":
-            cmd = f"npm install -g {self.value}"
-        elif self.kind == "go":
-            cmd = f"go install {self.value}@latest"
-        else:
-            raise ValueError(f"Unknown install method for kind={self.kind}")
+        try:
+            cmd = _CMD_TEMPLATES[self.kind].format(v=self.value)
+        except KeyError:
+            raise ValueError(f"Unknown install method for kind={self.kind}") from None
 
         # Add pre-install hook if necessary
         if self.pre_install_hook:
@@ -134,6 +141,63 @@ class Package(BaseModel):
             return cmd
 
 
+def _dependency_closure(kinds_used: List[str]) -> List[str]:
+    """
+    Expand the DEPENDENCIES table iteratively, following transitive kinds
+    (e.g. uv -> curlsh -> curl) with a visited set so each raw dependency
+    appears once, dependencies-first.
+    """
+    seen = set()
+    ordered = []
+    stack = []
+    for kind in reversed(kinds_used):
+        stack.extend(reversed(DEPENDENCIES.get(kind, [])))
+    while stack:
+        raw = stack.pop()
+        if raw in seen:
+            continue
+        seen.add(raw)
+        ordered.append(raw)
+        stack.extend(reversed(DEPENDENCIES.get(Package._from_trusted(raw).kind, [])))
+    return ordered
+
+
+# Partial-evaluate the dependency table once at import: kind -> the
+# transitive dependency install commands, so no Package objects are built
+# for the hard-coded dependency raws at render time.
+def _compile_dep_commands() -> dict:
+    return {
+        kind: tuple(
+            Package._from_trusted(raw).install_command()
+            for raw in _dependency_closure([kind])
+        )
+        for kind in DEPENDENCIES
+    }
+
+
+@lru_cache(maxsize=512)
+def _from_raw_cached(raw: str) -> Package:
+    """
+    Parse and validate a raw string once per unique input; Packages are
+    treated as immutable, so sharing cached instances is safe.
+    """
+    prefix, sep, value = raw.partition(":")
+    if sep:
+        return Package(kind=validate_kind(prefix.strip()), value=value.strip())
+    return Package(kind="system", value=raw.strip())
+
+
+_DEP_COMMANDS = _compile_dep_commands()
+
+
+def parse_many(raws) -> List[Package]:
+    """
+    Parse a batch of raw package strings (from YAML or the CLI) through the
+    shared from_raw cache in one pass.
+    """
+    return [_from_raw_cached(raw) for raw in raws]
+
+
 def get_install_script(packages: Union[str, List[str]]) -> str:
     if packages is None:
         return []
@@ -144,37 +208,27 @@ def get_install_script(packages: Union[str, List[str]]) -> str:
         if package.startswith("bundle:") or package.startswith("group:"):
             _package = package.split(":")[1].strip()
             bundled_packages.extend(bundles.get(_package, []))
-    packages = list(unique_everseen([*bundled_packages, *packages]))
-
-    packages = [Package.from_raw(raw) for raw in packages]
-    kinds_used = [package.kind for package in packages]
-    dependencies = []
-    for kind in kinds_used:
-        dependencies.extend(DEPENDENCIES.get(kind, []))
-    dependencies = list(
-        unique_everseen(
-            [Package.from_raw(raw).install_command() for raw in dependencies]
-        )
-    )
-    # for package in packages:
-    #     if package.dependencies:
-    #         dependencies.extend(
-    #             [dependency.install_command() for dependency in package.dependencies]
-    #         )
-    installs = [package.install_command() for package in packages]
-    post_hooks = []
-    for package in packages:
-        if package.post_install_hook:
-            post_hooks.append(package.post_install_hook.strip())
-    pre_hooks = []
-    for package in packages:
-        if package.pre_install_hook:
-            pre_hooks.append(package.pre_install_hook.strip())
-
-    # Final full script
-    full_script = list(
-        unique_everseen([*pre_hooks, *dependencies, *installs, *post_hooks])
-    )
+    packages = list(dict.fromkeys([*bundled_packages, *packages]))
+
+    # Packages are frozen/hashable, so spellings that parse to the same
+    # package ("wget" vs " wget ") collapse here rather than at output time
+    packages = list(dict.fromkeys(Package.from_raw(raw) for raw in packages))
+
+    def _lines():
+        # pre-hooks, then dependencies, then installs, then post-hooks
+        for package in packages:
+            if package.pre_install_hook:
+                yield package.pre_install_hook.strip()
+        for package in packages:
+            yield from _DEP_COMMANDS.get(package.kind, ())
+        for package in packages:
+            yield package.install_command()
+        for package in packages:
+            if package.post_install_hook:
+                yield package.post_install_hook.strip()
+
+    # Final full script, deduped in one pass
+    full_script = list(dict.fromkeys(_lines()))
     return "\n".join(full_script) if full_script else full_script
 
 
@@ -1,5 +1,4 @@
-from jinja2 import Environment, FileSystemLoader
-from krayt.package import get_install_script
+from functools import lru_cache
 from pathlib import Path
 
 # Get the two template directories
@@ -8,6 +7,49 @@ template_dirs = [
     Path.home() / ".config" / "krayt" / "templates",
 ]
 
-# Create the Jinja environment
-env = Environment(loader=FileSystemLoader([str(path) for path in template_dirs]))
-env.globals["get_install_script"] = get_install_script
+
+@lru_cache(maxsize=1)
+def _build_env():
+    """Build the Jinja environment on first use, not at import."""
+    from jinja2 import Environment, FileSystemBytecodeCache, FileSystemLoader
+    from krayt.package import get_install_script
+
+    # Persist compiled templates so repeated CLI runs skip re-parsing
+    cache_dir = Path.home() / ".cache" / "krayt" / "jinja"
+    cache_dir.mkdir(parents=True, exist_ok=True)
+
+    # Only pass directories that exist; the user config dir usually does
+    # not, and the loader would stat it on every lookup
+    existing = [str(path) for path in template_dirs if path.is_dir()]
+    if not existing:
+        raise FileNotFoundError(
+            f"No krayt template directories found, looked in: {template_dirs}"
+        )
+
+    # Templates are static per install, so skip mtime checks on every
+    # lookup; output is shell, not HTML, so autoescape stays off and
+    # trailing newlines are preserved
+    env = Environment(
+        loader=FileSystemLoader(existing),
+        autoescape=False,
+        keep_trailing_newline=True,
+        auto_reload=False,
+        cache_size=400,
+        bytecode_cache=FileSystemBytecodeCache(str(cache_dir)),
+    )
+    env.globals["get_install_script"] = get_install_script
+    return env
+
+
+def __getattr__(name):
+    # PEP 562: `from krayt.templates import env` still works, but commands
+    # that never render a template skip the environment setup entirely.
+    if name == "env":
+        return _build_env()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+@lru_cache(maxsize=None)
+def get_template(template_name: str):
+    """Look up a template once per process."""
+    return _build_env().get_template(template_name)
@@ -16,83 +16,124 @@ Hunt down storage issues and explore your persistent data like a true Tatooine d
 May the Force be with your volumes!
 """
 
-from iterfzf import iterfzf
-from kubernetes import client, config
+from __future__ import annotations
+
+import sys
+
+KRAYT_VERSION = "NIGHTLY"
+
+# Fast path: answer version queries before paying for any heavy imports
+if (
+    __name__ == "__main__"
+    and len(sys.argv) == 2
+    and sys.argv[1] in ("version", "-v", "--version")
+):
+    print(f"Version: {KRAYT_VERSION}")
+    sys.exit(0)
+
+from concurrent.futures import ThreadPoolExecutor, as_completed
+import copy
+import functools
+import hashlib
 import logging
 import os
 from pathlib import Path
-import time
 import typer
-from typing import Any, Optional
-import yaml
+from typing import TYPE_CHECKING, Any, Optional
 
-KRAYT_VERSION = "NIGHTLY"
+if TYPE_CHECKING:
+    # Annotations only; the runtime import stays deferred for startup speed
+    from kubernetes import client
 
 logging.basicConfig(level=logging.WARNING)
 
 app = typer.Typer()
 
 
+@functools.lru_cache(maxsize=1)
+def _kube():
+    """Load the kubeconfig once and return shared (CoreV1Api, BatchV1Api) clients."""
+    from kubernetes import client, config
+
+    config.load_kube_config()
+    # The default urllib3 pool caps out at 4 connections; widen it so
+    # concurrent requests don't queue at the HTTP layer
+    cfg = client.Configuration.get_default_copy()
+    cfg.connection_pool_maxsize = 16
+    api_client = client.ApiClient(configuration=cfg)
+    return client.CoreV1Api(api_client), client.BatchV1Api(api_client)
+
+
 def clean_dict(d: dict[str, Any]) -> dict[str, Any]:
     """Remove None values and empty dicts from a dictionary recursively."""
     if not isinstance(d, dict):
         return d
-    return {
-        k: clean_dict(v)
-        for k, v in d.items()
-        if v is not None and v != {} and not (isinstance(v, dict) and not clean_dict(v))
-    }
+    out = {}
+    for k, v in d.items():
+        if v is None:
+            continue
+        cv = clean_dict(v) if isinstance(v, dict) else v
+        if cv == {}:
+            continue
+        out[k] = cv
+    return out
+
+
+# Kubernetes-managed mounts/volumes to exclude; tuples so startswith checks
+# several prefixes in one call if more are ever added
+_SKIP_MOUNT_PREFIXES = ("/var/run/secrets/kubernetes.io/",)
+_SKIP_VOLUME_PREFIXES = ("kube-api-access-",)
 
 
 def format_volume_mount(vm: client.V1VolumeMount) -> dict[str, Any]:
     """Format volume mount with only relevant fields."""
     # Skip Kubernetes service account mounts
-    if vm.mount_path.startswith("/var/run/secrets/kubernetes.io/"):
+    if vm.mount_path.startswith(_SKIP_MOUNT_PREFIXES):
         return None
 
-    return clean_dict(
-        {
-            "name": vm.name,
-            "mountPath": vm.mount_path,
-            "readOnly": vm.read_only if vm.read_only else None,
-        }
-    )
-
+    # Fixed-shape dict; no need to round-trip it through clean_dict
+    d = {"name": vm.name, "mountPath": vm.mount_path}
+    if vm.read_only:
+        d["readOnly"] = True
+    return d
 
-def format_volume(v: client.V1Volume) -> dict[str, Any]:
-    """Format volume into a dictionary, return None if it should be skipped"""
-    # Skip Kubernetes service account volumes
-    if v.name.startswith("kube-api-access-"):
-        return None
 
-    volume_source = None
-    if v.persistent_volume_claim:
-        volume_source = {
-            "persistentVolumeClaim": {"claimName": v.persistent_volume_claim.claim_name}
-        }
-    elif v.config_map:
-        volume_source = {"configMap": {"name": v.config_map.name}}
-    elif v.secret:
-        volume_source = {"secret": {"secretName": v.secret.secret_name}}
-    elif v.host_path:  # Add support for hostPath volumes (used for device mounts)
-        volume_source = {
-            "hostPath": {
-                "path": v.host_path.path,
-                "type": v.host_path.type if v.host_path.type else None,
-            }
-        }
-    elif v.empty_dir:  # Add support for emptyDir volumes (used for /dev/shm)
-        volume_source = {
+# Supported volume source types and how to render each; first match wins.
+# hostPath covers device mounts, emptyDir covers /dev/shm.
+_VOLUME_BUILDERS = (
+    (
+        "persistent_volume_claim",
+        lambda s: {"persistentVolumeClaim": {"claimName": s.claim_name}},
+    ),
+    ("config_map", lambda s: {"configMap": {"name": s.name}}),
+    ("secret", lambda s: {"secret": {"secretName": s.secret_name}}),
+    (
+        "host_path",
+        lambda s: {"hostPath": {"path": s.path, **({"type": s.type} if s.type else {})}},
+    ),
+    (
+        "empty_dir",
+        lambda s: {
             "emptyDir": {
-                "medium": v.empty_dir.medium if v.empty_dir.medium else None,
-                "sizeLimit": v.empty_dir.size_limit if v.empty_dir.size_limit else None,
+                **({"medium": s.medium} if s.medium else {}),
+                **({"sizeLimit": s.size_limit} if s.size_limit else {}),
             }
-        }
+        },
+    ),
+)
+
 
-    if not volume_source:
+def format_volume(v: client.V1Volume) -> dict[str, Any]:
+    """Format volume into a dictionary, return None if it should be skipped"""
+    # Skip Kubernetes service account volumes
+    if v.name.startswith(_SKIP_VOLUME_PREFIXES):
         return None
 
-    return clean_dict({"name": v.name, **volume_source})
+    for attr, build in _VOLUME_BUILDERS:
+        source = getattr(v, attr)
+        if source:
+            return {"name": v.name, **build(source)}
+    return None
 
 
 def fuzzy_select(items):
@@ -104,20 +145,25 @@ def fuzzy_select(items):
     if len(items) == 1:
         return items[0]
 
-    # Format items for display
-    formatted_items = [f"{name} ({namespace})" for name, namespace in items]
+    # Stream formatted lines to fzf while recording how to map the
+    # selection back, so fzf starts filtering before the list is exhausted
+    index = {}
+
+    def _lines():
+        for name, namespace in items:
+            line = f"{name} ({namespace})"
+            index[line] = (name, namespace)
+            yield line
 
     # Use fzf for selection
     try:
-        selected = iterfzf(formatted_items)
+        from iterfzf import iterfzf
+
+        selected = iterfzf(_lines())
         if not selected:
             return None, None
 
-        # Parse selection back into name and namespace
-        # Example: "pod-name (namespace)" -> ("pod-name", "namespace")
-        name = selected.split(" (")[0]
-        namespace = selected.split(" (")[1][:-1]
-        return name, namespace
+        return index[selected]
 
     except Exception as e:
         typer.echo(f"Error during selection: {e}")
@@ -129,24 +175,40 @@ def get_pods(
     label_selector: str = "app=krayt",
 ):
     """Get list of pods in the specified namespace or all namespaces"""
+    from kubernetes import client
+
     try:
-        config.load_kube_config()
-        api = client.CoreV1Api()
-        if namespace:
-            pods = api.list_namespaced_pod(
-                namespace=namespace,
-                label_selector=label_selector,
-            )
-        else:
-            pods = api.list_pod_for_all_namespaces(
-                label_selector=label_selector,
-            )
+        api, _ = _kube()
+
+        # Page through the list so huge clusters don't force the apiserver
+        # to materialize one giant response
+        items = []
+        _continue = None
+        while True:
+            if namespace:
+                pods = api.list_namespaced_pod(
+                    namespace=namespace,
+                    label_selector=label_selector,
+                    limit=500,
+                    _continue=_continue,
+                )
+            else:
+                pods = api.list_pod_for_all_namespaces(
+                    label_selector=label_selector,
+                    limit=500,
+                    _continue=_continue,
+                )
+            items.extend(pods.items)
+            _continue = pods.metadata._continue
+            if not _continue:
+                break
 
-        # Convert to list of (name, namespace) tuples
+        # Convert to list of (name, namespace, pod) tuples so callers can
+        # reuse the full pod object without a second API call
         pod_list = []
-        for pod in pods.items:
+        for pod in items:
             if pod.metadata.namespace not in PROTECTED_NAMESPACES:
-                pod_list.append((pod.metadata.name, pod.metadata.namespace))
+                pod_list.append((pod.metadata.name, pod.metadata.namespace, pod))
         return pod_list
 
     except client.rest.ApiException as e:
@@ -155,20 +217,21 @@ def get_pods(
 
 
 def get_pod_spec(pod_name, namespace):
-    config.load_kube_config()
-    v1 = client.CoreV1Api()
+    v1, _ = _kube()
     return v1.read_namespaced_pod(pod_name, namespace)
 
 
 def get_pod_volumes_and_mounts(pod_spec):
     """Extract all volumes and mounts from a pod spec"""
+    from kubernetes import client
+
     volume_mounts = []
     for container in pod_spec.spec.containers:
         if container.volume_mounts:
             volume_mounts.extend(container.volume_mounts)
 
-    # Filter out None values from volume mounts
-    volume_mounts = [vm for vm in volume_mounts if format_volume_mount(vm)]
+    # Format once, dropping service-account mounts
+    volume_mounts = [fm for vm in volume_mounts if (fm := format_volume_mount(vm))]
 
     # Get all volumes, including device mounts
     volumes = []
@@ -203,51 +266,49 @@ def get_pod_volumes_and_mounts(pod_spec):
             else:
                 volumes.append(v)
 
-    # Filter out None values from volumes
-    volumes = [v for v in volumes if format_volume(v)]
+    # Drop service-account volumes here without formatting; volumes with no
+    # recognized source fall out in create_inspector_job's single
+    # format_volume pass
+    volumes = [v for v in volumes if not v.name.startswith(_SKIP_VOLUME_PREFIXES)]
 
     return volume_mounts, volumes
 
 
+PROXY_VARS = (
+    "HTTP_PROXY",
+    "HTTPS_PROXY",
+    "NO_PROXY",
+    "http_proxy",
+    "https_proxy",
+    "no_proxy",
+)
+
+
 def get_env_vars_and_secret_volumes(api, namespace: str):
     """Get environment variables and secret volumes for the inspector pod"""
-    env_vars = []
-    volumes = []
+    from kubernetes import client
 
     # Add proxy environment variables if they exist in the host environment
-    proxy_vars = [
-        "HTTP_PROXY",
-        "HTTPS_PROXY",
-        "NO_PROXY",
-        "http_proxy",
-        "https_proxy",
-        "no_proxy",
+    env_vars = [
+        {"name": var, "value": value}
+        for var in PROXY_VARS
+        if (value := os.environ.get(var))
     ]
+    volumes = []
 
-    for var in proxy_vars:
-        if var in os.environ:
-            env_vars.append({"name": var, "value": os.environ[var]})
-
-    # Look for secret volumes in the namespace
+    # Look for secret volumes in the namespace; let the apiserver filter
+    # out service account tokens and other non-Opaque secrets
     try:
-        secrets = api.list_namespaced_secret(namespace)
-        for secret in secrets.items:
-            # Skip service account tokens and other system secrets
-            if secret.type != "Opaque" or secret.metadata.name.startswith(
-                "default-token-"
-            ):
-                continue
-
-            # Mount each secret as a volume
-            volume_name = f"secret-{secret.metadata.name}"
-            volumes.append(
-                client.V1Volume(
-                    name=volume_name,
-                    secret=client.V1SecretVolumeSource(
-                        secret_name=secret.metadata.name
-                    ),
-                )
+        secrets = api.list_namespaced_secret(namespace, field_selector="type=Opaque")
+        # Mount each secret as a volume
+        volumes = [
+            client.V1Volume(
+                name=f"secret-{secret.metadata.name}",
+                secret=client.V1SecretVolumeSource(secret_name=secret.metadata.name),
             )
+            for secret in secrets.items
+            if not secret.metadata.name.startswith("default-token-")
+        ]
 
     except client.exceptions.ApiException as e:
         if e.status != 404:  # Ignore if no secrets found
@@ -256,54 +317,80 @@ def get_env_vars_and_secret_volumes(api, namespace: str):
     return env_vars, volumes
 
 
+@functools.lru_cache(maxsize=8)
+def _build_init_script(script_keys: tuple) -> str:
+    """Concatenate init scripts, cached on (path, mtime_ns, size) keys."""
+    # Create a combined script that will run all init scripts
+    parts = [
+        "#!/bin/bash\n\n",
+        "exec 2>&1  # Redirect stderr to stdout for proper logging\n",
+        "set -e     # Exit on error\n\n",
+        "echo 'Running initialization scripts...' | tee /tmp/init.log\n\n",
+        "mkdir -p /tmp/init.d\n\n",  # Create directory once at the start
+    ]
+
+    for path, _mtime_ns, _size in script_keys:
+        script = Path(path)
+        try:
+            script_content = script.read_bytes().decode()
+        except Exception as e:
+            logging.error(f"Failed to load init script {script}: {e}")
+            continue
+
+        if not script_content.strip():
+            logging.debug("Skipping empty script %s", script)
+            continue
+
+        # Use a unique heredoc delimiter for each script to avoid nesting issues
+        delimiter = f"EOF_SCRIPT_{script.stem.upper()}"
+
+        parts.append(f"echo '=== Running {script.name} ===' | tee -a /tmp/init.log\n")
+        parts.append(f"cat > /tmp/init.d/{script.name} << '{delimiter}'\n")
+        parts.append(script_content)
+        if not script_content.endswith("\n"):
+            parts.append("\n")
+        parts.append(f"{delimiter}\n")
+        parts.append(f"chmod +x /tmp/init.d/{script.name}\n")
+        parts.append(
+            f"cd /tmp/init.d && ./{script.name} 2>&1 | tee -a /tmp/init.log || {{ echo \"Failed to run {script.name}\"; exit 1; }}\n"
+        )
+        parts.append(f"echo '=== Finished {script.name} ===' | tee -a /tmp/init.log\n\n")
+
+    parts.append("echo 'Initialization scripts complete.' | tee -a /tmp/init.log\n")
+    return "".join(parts)
+
+
 def get_init_scripts():
     """Get the contents of init scripts to be run in the pod"""
     init_dir = Path.home() / ".config" / "krayt" / "init.d"
-    if not init_dir.exists():
+    try:
+        with os.scandir(init_dir) as entries:
+            scripts = sorted(
+                entry.path
+                for entry in entries
+                if entry.is_file() and entry.name.endswith(".sh")
+            )
+    except FileNotFoundError:
         logging.debug("No init.d directory found at %s", init_dir)
         return ""
 
-    scripts = sorted(init_dir.glob("*.sh"))
     if not scripts:
         logging.debug("No init scripts found in %s", init_dir)
         return ""
 
-    # Create a combined script that will run all init scripts
-    init_script = "#!/bin/bash\n\n"
-    init_script += "exec 2>&1  # Redirect stderr to stdout for proper logging\n"
-    init_script += "set -e     # Exit on error\n\n"
-    init_script += "echo 'Running initialization scripts...' | tee /tmp/init.log\n\n"
-    init_script += "mkdir -p /tmp/init.d\n\n"  # Create directory once at the start
-
-    for script in scripts:
-        try:
-            with open(script, "r") as f:
-                script_content = f.read()
-                if not script_content.strip():
-                    logging.debug("Skipping empty script %s", script)
-                    continue
-
-                # Use a unique heredoc delimiter for each script to avoid nesting issues
-                delimiter = f"EOF_SCRIPT_{script.stem.upper()}"
-                
-                init_script += f"echo '=== Running {script.name} ===' | tee -a /tmp/init.log\n"
-                init_script += f"cat > /tmp/init.d/{script.name} << '{delimiter}'\n"
-                init_script += script_content
-                if not script_content.endswith("\n"):
-                    init_script += "\n"
-                init_script += f"{delimiter}\n"
-                init_script += f"chmod +x /tmp/init.d/{script.name}\n"
-                init_script += f"cd /tmp/init.d && ./{script.name} 2>&1 | tee -a /tmp/init.log || {{ echo \"Failed to run {script.name}\"; exit 1; }}\n"
-                init_script += f"echo '=== Finished {script.name} ===' | tee -a /tmp/init.log\n\n"
-        except Exception as e:
-            logging.error(f"Failed to load init script {script}: {e}")
-
-    init_script += "echo 'Initialization scripts complete.' | tee -a /tmp/init.log\n"
-    return init_script
+    # Key the cache on each script's stat so edits invalidate it
+    script_keys = tuple(
+        (path, stat.st_mtime_ns, stat.st_size)
+        for path in scripts
+        for stat in (os.stat(path),)
+    )
+    return _build_init_script(script_keys)
 
 
 def get_motd_script(mount_info, pvc_info):
-    """Generate the MOTD script with proper escaping"""
+    """Generate the MOTD script with the mount and PVC lines pre-rendered"""
+    mount_lines = "\n".join(f"- {mount}" for mount in mount_info)
+    pvc_lines = "\n".join(f"- {pvc}" for pvc in pvc_info)
     return f"""
 # Create MOTD
 cat << EOF > /etc/motd
@@ -315,10 +402,10 @@ A safe haven for volume inspection
 "Inside every volume lies a pearl of wisdom waiting to be discovered."
 
 Mounted Volumes:
-$(echo "{",".join(mount_info)}" | tr ',' '\\n' | sed 's/^/- /')
+{mount_lines}
 
 Persistent Volume Claims:
-$(echo "{",".join(pvc_info)}" | tr ',' '\\n' | sed 's/^/- /')
+{pvc_lines}
 
 Mounted Secrets:
 $(for d in /mnt/secrets/*; do if [ -d "$d" ]; then echo "- $(basename $d)"; fi; done)
@@ -329,6 +416,129 @@ EOF
 """
 
 
+# Invariant portion of the inspector startup script, joined once at import
+_STATIC_CMD_PREFIX = "\n".join(
+    [
+        "# Configure apk proxy settings",
+        "mkdir -p /etc/apk",
+        "cat > /etc/apk/repositories << 'EOF'",
+        "https://dl-cdn.alpinelinux.org/alpine/latest-stable/main",
+        "https://dl-cdn.alpinelinux.org/alpine/latest-stable/community",
+        "EOF",
+        "",
+        'if [ ! -z "$HTTP_PROXY" ]; then',
+        '  echo "Setting up apk proxy configuration..."',
+        "  mkdir -p /etc/apk/",
+        "  cat > /etc/apk/repositories << EOF",
+        "#/media/cdrom/apks",
+        "http://dl-cdn.alpinelinux.org/alpine/latest-stable/main",
+        "http://dl-cdn.alpinelinux.org/alpine/latest-stable/community",
+        "",
+        "# Configure proxy",
+        "proxy=$HTTP_PROXY",
+        "EOF",
+        "fi",
+        "",
+        "# Install basic tools first; --no-cache fetches the index once",
+        "apk add --no-cache curl",
+        "",
+        "# Install uv CLI",
+        "echo 'Installing uv CLI...'",
+        "curl -LsSf https://astral.sh/uv/install.sh | sh",
+        "echo 'uv version:'",
+        "uv --version",
+        "",
+        "echo 'Installing starship...'",
+        "curl -sS https://starship.rs/install.sh | sh -s -- -y",
+        "echo 'starship version:'",
+        "starship --version",
+        "",
+        "",
+        "# Install additional tools",
+        "apk add --no-cache "
+        + " ".join(
+            [
+                "ripgrep",
+                "exa",
+                "ncdu",
+                "dust",
+                "file",
+                "hexyl",
+                "jq",
+                "yq",
+                "bat",
+                "fd",
+                "fzf",
+                "htop",
+                "bottom",
+                "difftastic",
+                "mtr",
+                "bind-tools",
+                "aws-cli",
+                "sqlite",
+                "sqlite-dev",
+                "sqlite-libs",
+                "bash",
+                "neovim",
+            ]
+        ),
+        "",
+    ]
+)
+
+# Invariant shell/RC setup that follows any init scripts
+_STATIC_SHELL_SETUP = "\n".join(
+    [
+        "# Create .ashrc with MOTD",
+        "cat > /root/.ashrc << 'EOF'",
+        "# Display MOTD on login",
+        "[ -f /etc/motd ] && cat /etc/motd",
+        "# Set up shell environment",
+        "export EDITOR=vi",
+        "export PAGER=less",
+        "# Set up aliases",
+        "alias ll='ls -la'",
+        "alias l='ls -la'",
+        "alias la='ls -la'",
+        "alias vi='vim'",
+        "# Set up PATH",
+        "export PATH=/root/.local/bin:$PATH",
+        'eval "$(starship init bash)"',
+        "EOF",
+        "",
+        "",
+        "# Set up environment to always source our RC file",
+        "echo 'export ENV=/root/.ashrc' > /etc/profile",
+        "echo 'export ENV=/root/.ashrc' > /etc/environment",
+        "",
+        "# Make RC file available to all shells",
+        "mkdir -p /etc/profile.d",
+        "cp /root/.ashrc /etc/profile.d/motd.sh",
+        "ln -sf /root/.ashrc /root/.profile",
+        "ln -sf /root/.ashrc /root/.bashrc",
+        "ln -sf /root/.ashrc /root/.mkshrc",
+        "ln -sf /root/.ashrc /etc/shinit",
+        "",
+    ]
+)
+
+# Invariant manifest skeleton; deep-copied and patched per job
+_JOB_SKELETON = {
+    "apiVersion": "batch/v1",
+    "kind": "Job",
+    "metadata": {"labels": {"app": "krayt"}},
+    "spec": {
+        "template": {
+            "metadata": {"labels": {"app": "krayt"}},
+            "spec": {
+                "containers": [{"name": "inspector"}],
+                "restartPolicy": "Never",
+            },
+        },
+    },
+}
+
+
 def create_inspector_job(
     api,
     namespace: str,
@@ -339,8 +549,12 @@ def create_inspector_job(
     imagepullsecret: Optional[str] = None,
 ):
     """Create a Krayt inspector job with the given mounts"""
-    timestamp = int(time.time())
-    job_name = f"{pod_name}-krayt-{timestamp}"
+    # Deterministic suffix so re-running against the same pod produces the
+    # same manifest and `kubectl apply` stays a no-op
+    suffix = hashlib.blake2b(
+        f"{namespace}:{pod_name}".encode(), digest_size=4
+    ).hexdigest()
+    job_name = f"{pod_name}-krayt-{suffix}"
 
     # Get environment variables and secret volumes from the target pod
     env_vars, secret_volumes = get_env_vars_and_secret_volumes(api, namespace)
@@ -359,96 +573,28 @@ def create_inspector_job(
             }
         )
 
-    # Convert volume mounts to dictionaries
-    formatted_mounts = [format_volume_mount(vm) for vm in volume_mounts]
-    formatted_mounts.extend(secret_mounts)
+    # Volume mounts arrive already formatted as dictionaries
+    formatted_mounts = [*volume_mounts, *secret_mounts]
 
     # Format mount and PVC info for MOTD
-    mount_info = []
-    for vm in formatted_mounts:
-        if vm:
-            mount_info.append(f"{vm['name']}:{vm['mountPath']}")
+    mount_info = [f"{vm['name']}:{vm['mountPath']}" for vm in formatted_mounts]
 
+    # Format volumes exactly once for the manifest, collecting PVC info
+    # for the MOTD in the same pass
     pvc_info = []
+    formatted_volumes = []
     for v in volumes:
-        if hasattr(v, "persistent_volume_claim") and v.persistent_volume_claim:
-            pvc_info.append(f"{v.name}:{v.persistent_volume_claim.claim_name}")
+        fv = format_volume(v)
+        if not fv:
+            continue
+        formatted_volumes.append(fv)
+        if claim := fv.get("persistentVolumeClaim"):
+            pvc_info.append(f"{v.name}:{claim['claimName']}")
 
     init_scripts = get_init_scripts()
 
-    # Build the command script
-    command_parts = []
-
-    # Configure apk proxy settings BEFORE any package installation
-    command_parts.extend(
-        [
-            "# Configure apk proxy settings",
-            "mkdir -p /etc/apk",
-            "cat > /etc/apk/repositories << 'EOF'",
-            "https://dl-cdn.alpinelinux.org/alpine/latest-stable/main",
-            "https://dl-cdn.alpinelinux.org/alpine/latest-stable/community",
-            "EOF",
-            "",
-            'if [ ! -z "$HTTP_PROXY" ]; then',
-            '  echo "Setting up apk proxy configuration..."',
-            "  mkdir -p /etc/apk/",
-            "  cat > /etc/apk/repositories << EOF",
-            "#/media/cdrom/apks",
-            "http://dl-cdn.alpinelinux.org/alpine/latest-stable/main",
-            "http://dl-cdn.alpinelinux.org/alpine/latest-stable/community",
-            "",
-            "# Configure proxy",
-            "proxy=$HTTP_PROXY",
-            "EOF",
-            "fi",
-            "",
-            "# Install basic tools first",
-            "apk update",
-            "apk add curl",
-            "",
-            "# Install uv CLI",
-            "echo 'Installing uv CLI...'",
-            "curl -LsSf https://astral.sh/uv/install.sh | sh",
-            "echo 'uv version:'",
-            "uv --version",
-            "",
-            "echo 'Installing starship...'",
-            "curl -sS https://starship.rs/install.sh | sh -s -- -y",
-            "echo 'starship version:'",
-            "starship --version",
-            "",
-            "",
-            "# Install additional tools",
-            "apk add "
-            + " ".join(
-                [
-                    "ripgrep",
-                    "exa",
-                    "ncdu",
-                    "dust",
-                    "file",
-                    "hexyl",
-                    "jq",
-                    "yq",
-                    "bat",
-                    "fd",
-                    "fzf",
-                    "htop",
-                    "bottom",
-                    "difftastic",
-                    "mtr",
-                    "bind-tools",
-                    "aws-cli",
-                    "sqlite",
-                    "sqlite-dev",
-                    "sqlite-libs",
-                    "bash",
-                    "neovim",
-                ]
-            ),
-            "",
-        ]
-    )
+    # Build the command script, starting from the precomputed static prefix
+    command_parts = [_STATIC_CMD_PREFIX]
 
     # Add init scripts if present
     if init_scripts:
@@ -472,73 +618,32 @@ def create_inspector_job(
     # Add shell setup and MOTD
     command_parts.extend(
         [
-            "# Create .ashrc with MOTD",
-            "cat > /root/.ashrc << 'EOF'",
-            "# Display MOTD on login",
-            "[ -f /etc/motd ] && cat /etc/motd",
-            "# Set up shell environment",
-            "export EDITOR=vi",
-            "export PAGER=less",
-            "# Set up aliases",
-            "alias ll='ls -la'",
-            "alias l='ls -la'",
-            "alias la='ls -la'",
-            "alias vi='vim'",
-            "# Set up PATH",
-            "export PATH=/root/.local/bin:$PATH",
-            'eval "$(starship init bash)"',
-            "EOF",
-            "",
-            "",
-            "# Set up environment to always source our RC file",
-            "echo 'export ENV=/root/.ashrc' > /etc/profile",
-            "echo 'export ENV=/root/.ashrc' > /etc/environment",
-            "",
-            "# Make RC file available to all shells",
-            "mkdir -p /etc/profile.d",
-            "cp /root/.ashrc /etc/profile.d/motd.sh",
-            "ln -sf /root/.ashrc /root/.profile",
-            "ln -sf /root/.ashrc /root/.bashrc",
-            "ln -sf /root/.ashrc /root/.mkshrc",
-            "ln -sf /root/.ashrc /etc/shinit",
-            "",
+            _STATIC_SHELL_SETUP,
             "# Update MOTD",
             get_motd_script(mount_info, pvc_info),
             "",
-            "# Keep container running",
-            "tail -f /dev/null",
+            "# Keep container running without a pointless tail pipe",
+            "exec sleep infinity",
         ]
     )
 
-    inspector_job = {
-        "apiVersion": "batch/v1",
-        "kind": "Job",
-        "metadata": {
-            "name": job_name,
-            "namespace": namespace,
-            "labels": {"app": "krayt"},
-            "annotations": {"pvcs": ",".join(pvc_info) if pvc_info else "none"},
-        },
-        "spec": {
-            "template": {
-                "metadata": {"labels": {"app": "krayt"}},
-                "spec": {
-                    "containers": [
-                        {
-                            "name": "inspector",
-                            "image": image,
-                            "command": ["sh", "-c", "\n".join(command_parts)],
-                            "env": env_vars,
-                            "volumeMounts": formatted_mounts,
-                        }
-                    ],
-                    "volumes": [format_volume(v) for v in volumes if format_volume(v)],
-                    "imagePullSecrets": [{"name": imagepullsecret}] if imagepullsecret else None,
-                    "restartPolicy": "Never",
-                },
-            },
-        },
+    # Patch the per-job fields into a copy of the invariant skeleton
+    inspector_job = copy.deepcopy(_JOB_SKELETON)
+    inspector_job["metadata"]["name"] = job_name
+    inspector_job["metadata"]["namespace"] = namespace
+    inspector_job["metadata"]["annotations"] = {
+        "pvcs": ",".join(pvc_info) if pvc_info else "none"
     }
+    pod_template_spec = inspector_job["spec"]["template"]["spec"]
+    container = pod_template_spec["containers"][0]
+    container["image"] = image
+    container["command"] = ["sh", "-c", "\n".join(command_parts)]
+    container["env"] = env_vars
+    container["volumeMounts"] = formatted_mounts
+    pod_template_spec["volumes"] = formatted_volumes
+    pod_template_spec["imagePullSecrets"] = (
+        [{"name": imagepullsecret}] if imagepullsecret else None
+    )
     return inspector_job
 
 
@@ -562,16 +667,36 @@ PROTECTED_NAMESPACES = {
 def load_init_scripts():
     """Load and execute initialization scripts from ~/.config/krayt/scripts/"""
     init_dir = Path.home() / ".config" / "krayt" / "scripts"
-    if not init_dir.exists():
+    try:
+        with os.scandir(init_dir) as entries:
+            # Sort scripts to ensure consistent execution order
+            scripts = sorted(
+                entry.path
+                for entry in entries
+                if entry.is_file() and entry.name.endswith(".py")
+            )
+    except FileNotFoundError:
         return
 
-    # Sort scripts to ensure consistent execution order
-    scripts = sorted(init_dir.glob("*.py"))
+    import importlib.util
 
-    for script in scripts:
+    for i, script in enumerate(scripts):
         try:
-            with open(script, "r") as f:
-                exec(f.read(), globals())
+            # Importing as a module lets Python reuse cached __pycache__
+            # bytecode instead of re-compiling the source on every run
+            spec = importlib.util.spec_from_file_location(f"krayt_init_{i}", script)
+            module = importlib.util.module_from_spec(spec)
+            # Scripts historically ran via exec(source, globals()) and may
+            # lean on krayt1's ambient names (app, typer, ...); seed the
+            # module namespace with them before execution
+            module.__dict__.update(
+                {k: v for k, v in globals().items() if not k.startswith("__")}
+            )
+            spec.loader.exec_module(module)
+            # Preserve the old exec() behavior of exposing script globals
+            globals().update(
+                {k: v for k, v in vars(module).items() if not k.startswith("__")}
+            )
             logging.debug(f"Loaded init script: {script}")
         except Exception as e:
             logging.error(f"Failed to load init script {script}: {e}")
@@ -580,16 +705,7 @@ def load_init_scripts():
 def setup_environment():
     """Set up the environment with proxy settings and other configurations"""
     # Load environment variables for proxies
-    proxy_vars = [
-        "HTTP_PROXY",
-        "HTTPS_PROXY",
-        "NO_PROXY",
-        "http_proxy",
-        "https_proxy",
-        "no_proxy",
-    ]
-
-    for var in proxy_vars:
+    for var in PROXY_VARS:
         if var in os.environ:
             # Make both upper and lower case versions available
             os.environ[var.upper()] = os.environ[var]
@@ -616,6 +732,95 @@ def main(
         ctx.get_help()
 
 
+def interactive_exec(pod_name: str, namespace: str):
+    """Attach an interactive shell to the pod over the existing API session."""
+    import json
+    import select
+    import signal
+    import sys
+    import termios
+    import tty
+
+    from kubernetes.stream import stream
+
+    typer.echo(f"Connecting to pod {pod_name} in namespace {namespace}...")
+    v1, _ = _kube()
+    command = ["/bin/bash", "-l"]
+    resp = None
+
+    # Save the current terminal settings
+    oldtty = termios.tcgetattr(sys.stdin)
+
+    def handle_resize(signum, frame):
+        if resp and resp.is_open():
+            cols, rows = os.get_terminal_size()
+            # Format matches kubectl's resize message format
+            resize_msg = json.dumps({"Width": cols, "Height": rows})
+            resp.write_channel(4, resize_msg)
+
+    def handle_exit(signum, frame):
+        if resp and resp.is_open():
+            # Send Ctrl+C to the remote process
+            resp.write_stdin("\x03")
+
+    try:
+        # Raw mode; the remote terminal handles echoing and control characters
+        tty.setraw(sys.stdin.fileno())
+
+        signal.signal(signal.SIGWINCH, handle_resize)  # Window resize
+        signal.signal(signal.SIGINT, handle_exit)  # Ctrl+C
+
+        resp = stream(
+            v1.connect_get_namespaced_pod_exec,
+            pod_name,
+            namespace,
+            command=command,
+            stderr=True,
+            stdin=True,
+            stdout=True,
+            tty=True,
+            _preload_content=False,
+        )
+
+        # Send initial terminal size
+        handle_resize(None, None)
+
+        while resp and resp.is_open():
+            resp.update(timeout=0.1)
+
+            if resp.peek_stdout():
+                sys.stdout.write(resp.read_stdout())
+                sys.stdout.flush()
+            if resp.peek_stderr():
+                sys.stderr.write(resp.read_stderr())
+                sys.stderr.flush()
+
+            rlist, _, _ = select.select([sys.stdin], [], [], 0.01)
+            if sys.stdin in rlist:
+                data = os.read(sys.stdin.fileno(), 1024)
+                if not data:  # EOF (e.g., user pressed Ctrl+D)
+                    break
+                resp.write_stdin(data.decode())
+
+    except KeyboardInterrupt:
+        print("\nSession terminated by user", file=sys.stderr)
+    except Exception as e:
+        print(f"\nError in interactive session: {e}", file=sys.stderr)
+    finally:
+        signal.signal(signal.SIGWINCH, signal.SIG_DFL)
+        signal.signal(signal.SIGINT, signal.SIG_DFL)
+
+        if resp and resp.is_open():
+            try:
+                resp.close()
+            except Exception:
+                pass
+
+        # Always restore terminal settings
+        termios.tcsetattr(sys.stdin, termios.TCSADRAIN, oldtty)
+        print("\nConnection closed", file=sys.stderr)
+
+
 @app.command()
 def exec(
     namespace: Optional[str] = typer.Option(
@@ -627,8 +832,9 @@ def exec(
     Enter the Krayt dragon's lair! Connect to a running inspector pod.
     If multiple inspectors are found, you'll get to choose which one to explore.
     """
-    config.load_kube_config()
-    batch_api = client.BatchV1Api()
+    from kubernetes import client
+
+    v1, batch_api = _kube()
 
     try:
         if namespace:
@@ -640,19 +846,27 @@ def exec(
             logging.debug("Listing jobs in all namespaces")
             jobs = batch_api.list_job_for_all_namespaces(label_selector="app=krayt")
 
-        running_inspectors = []
-        for job in jobs.items:
-            # Get the pod for this job
-            v1 = client.CoreV1Api()
+        job_names = {job.metadata.name for job in jobs.items}
+
+        # One pod list covers every job; the job template labels pods
+        # app=krayt, and the apiserver filters out non-running pods for us
+        if namespace:
             pods = v1.list_namespaced_pod(
-                namespace=job.metadata.namespace,
-                label_selector=f"job-name={job.metadata.name}",
+                namespace=namespace,
+                label_selector="app=krayt",
+                field_selector="status.phase=Running",
+            )
+        else:
+            pods = v1.list_pod_for_all_namespaces(
+                label_selector="app=krayt",
+                field_selector="status.phase=Running",
             )
-            for pod in pods.items:
-                if pod.status.phase == "Running":
-                    running_inspectors.append(
-                        (pod.metadata.name, pod.metadata.namespace)
-                    )
+
+        running_inspectors = [
+            (pod.metadata.name, pod.metadata.namespace)
+            for pod in pods.items
+            if (pod.metadata.labels or {}).get("job-name") in job_names
+        ]
 
         if not running_inspectors:
             typer.echo("No running inspector pods found.")
@@ -666,19 +880,9 @@ def exec(
                 typer.echo("No inspector selected.")
                 raise typer.Exit(1)
 
-        exec_command = [
-            "kubectl",
-            "exec",
-            "-it",
-            "-n",
-            pod_namespace,
-            pod_name,
-            "--",
-            "/bin/bash",
-            "-l",
-        ]
-
-        os.execvp("kubectl", exec_command)
+        # Reuse the already-authenticated API session instead of paying for
+        # a kubectl subprocess that re-parses kubeconfig and re-auths
+        interactive_exec(pod_name, pod_namespace)
 
     except client.exceptions.ApiException as e:
         logging.error(f"Failed to list jobs: {e}")
@@ -703,8 +907,9 @@ def clean(
     Clean up after your hunt! Remove all Krayt inspector jobs.
     Use --yes/-y to skip confirmation and clean up immediately.
     """
-    config.load_kube_config()
-    batch_api = client.BatchV1Api()
+    from kubernetes import client
+
+    _, batch_api = _kube()
 
     try:
         if namespace:
@@ -712,54 +917,61 @@ def clean(
                 typer.echo(f"Error: Cannot cleanup in protected namespace {namespace}")
                 raise typer.Exit(1)
             logging.debug(f"Listing jobs in namespace {namespace}")
-            jobs = batch_api.list_namespaced_job(
+            job_items = batch_api.list_namespaced_job(
                 namespace=namespace, label_selector="app=krayt"
-            )
+            ).items
         else:
+            # One round trip: the label selector already narrows the payload
+            # server-side, so just drop protected namespaces client-side
             logging.debug("Listing jobs in all namespaces")
-            jobs = batch_api.list_job_for_all_namespaces(label_selector="app=krayt")
-
-        # Filter out jobs in protected namespaces
-        jobs.items = [
-            job
-            for job in jobs.items
-            if job.metadata.namespace not in PROTECTED_NAMESPACES
-        ]
+            job_items = [
+                job
+                for job in batch_api.list_job_for_all_namespaces(
+                    label_selector="app=krayt"
+                ).items
+                if job.metadata.namespace not in PROTECTED_NAMESPACES
+            ]
 
-        if not jobs.items:
+        if not job_items:
             typer.echo("No Krayt inspector jobs found.")
             return
 
         # Show confirmation prompt
         if not yes:
             job_list = "\n".join(
-                f"  {job.metadata.namespace}/{job.metadata.name}" for job in jobs.items
+                f"  {job.metadata.namespace}/{job.metadata.name}" for job in job_items
             )
             typer.echo(f"The following inspector jobs will be deleted:\n{job_list}")
             if not typer.confirm("Are you sure you want to continue?"):
                 typer.echo("Operation cancelled.")
                 return
 
-        # Delete each job
-        for job in jobs.items:
-            try:
-                logging.debug(
-                    f"Deleting job {job.metadata.namespace}/{job.metadata.name}"
-                )
-                batch_api.delete_namespaced_job(
-                    name=job.metadata.name,
-                    namespace=job.metadata.namespace,
-                    body=client.V1DeleteOptions(propagation_policy="Background"),
-                )
-                typer.echo(f"Deleted job: {job.metadata.namespace}/{job.metadata.name}")
-            except client.exceptions.ApiException as e:
-                logging.error(
-                    f"Failed to delete job {job.metadata.namespace}/{job.metadata.name}: {e}"
-                )
-                typer.echo(
-                    f"Failed to delete job {job.metadata.namespace}/{job.metadata.name}: {e}",
-                    err=True,
-                )
+        # Delete jobs concurrently; each delete is a synchronous round-trip
+        def _delete(job):
+            logging.debug(f"Deleting job {job.metadata.namespace}/{job.metadata.name}")
+            batch_api.delete_namespaced_job(
+                name=job.metadata.name,
+                namespace=job.metadata.namespace,
+                body=client.V1DeleteOptions(propagation_policy="Background"),
+            )
+
+        with ThreadPoolExecutor(max_workers=16) as executor:
+            futures = {executor.submit(_delete, job): job for job in job_items}
+            for future in as_completed(futures):
+                job = futures[future]
+                try:
+                    future.result()
+                    typer.echo(
+                        f"Deleted job: {job.metadata.namespace}/{job.metadata.name}"
+                    )
+                except client.exceptions.ApiException as e:
+                    logging.error(
+                        f"Failed to delete job {job.metadata.namespace}/{job.metadata.name}: {e}"
+                    )
+                    typer.echo(
+                        f"Failed to delete job {job.metadata.namespace}/{job.metadata.name}: {e}",
+                        err=True,
+                    )
 
     except client.exceptions.ApiException as e:
         logging.error(f"Failed to list jobs: {e}")
@@ -790,22 +1002,36 @@ def create(
     If namespace is not specified, will search for pods across all namespaces.
     The inspector will be created in the same namespace as the selected pod.
     """
+    import yaml
+
+    try:
+        # libyaml's C emitter when available
+        from yaml import CSafeDumper as SafeDumper
+    except ImportError:
+        from yaml import SafeDumper
+
     # For create, we want to list all pods, not just Krayt pods
     pods = get_pods(namespace, label_selector=None)
     if not pods:
         typer.echo("No pods found.")
         raise typer.Exit(1)
 
-    selected_pod, selected_namespace = fuzzy_select(pods)
+    selected_pod, selected_namespace = fuzzy_select(
+        [(name, ns) for name, ns, _ in pods]
+    )
     if not selected_pod:
         typer.echo("No pod selected.")
         raise typer.Exit(1)
 
-    pod_spec = get_pod_spec(selected_pod, selected_namespace)
+    # The list response already contains the full pod spec; reuse it
+    # instead of a second read_namespaced_pod round-trip
+    pod_index = {(name, ns): pod for name, ns, pod in pods}
+    pod_spec = pod_index[(selected_pod, selected_namespace)]
     volume_mounts, volumes = get_pod_volumes_and_mounts(pod_spec)
 
+    api, _ = _kube()
     inspector_job = create_inspector_job(
-        client.CoreV1Api(),
+        api,
         selected_namespace,
         selected_pod,
         volume_mounts,
@@ -814,8 +1040,15 @@ def create(
         imagepullsecret=imagepullsecret,
     )
 
-    # Output the job manifest
-    typer.echo(yaml.dump(clean_dict(inspector_job), sort_keys=False))
+    # Stream the job manifest straight to stdout instead of building one
+    # large string first
+    yaml.dump(
+        clean_dict(inspector_job),
+        sys.stdout,
+        Dumper=SafeDumper,
+        sort_keys=False,
+        default_flow_style=False,
+    )
 
 
 @app.command()
@@ -841,19 +1074,22 @@ def logs(
     View logs from a Krayt inspector pod.
     If multiple inspectors are found, you'll get to choose which one to explore.
     """
+    from kubernetes import client
+
     pods = get_pods(namespace)
     if not pods:
         typer.echo("No pods found.")
         raise typer.Exit(1)
 
-    selected_pod, selected_namespace = fuzzy_select(pods)
+    selected_pod, selected_namespace = fuzzy_select(
+        [(name, ns) for name, ns, _ in pods]
+    )
     if not selected_pod:
         typer.echo("No pod selected.")
         raise typer.Exit(1)
 
     try:
-        config.load_kube_config()
-        api = client.CoreV1Api()
+        api, _ = _kube()
         logs = api.read_namespaced_pod_log(
             name=selected_pod,
             namespace=selected_namespace,
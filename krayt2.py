@@ -9,6 +9,7 @@
 # ///
 
 from InquirerPy import inquirer
+from functools import lru_cache
 from kubernetes import client, config
 import os
 import typer
@@ -41,6 +42,13 @@ def load_kube_config():
         raise typer.Exit(1)
 
 
+@lru_cache(maxsize=1)
+def get_core_v1() -> client.CoreV1Api:
+    """Load kubeconfig once and reuse a single CoreV1Api for the process."""
+    load_kube_config()
+    return client.CoreV1Api()
+
+
 def detect_package_manager_command() -> str:
     checks = [
         f"which {pm} >/dev/null 2>&1 && echo {cmd}"
@@ -67,8 +75,7 @@ def get_proxy_env_vars() -> List[client.V1EnvVar]:
 
 
 def fuzzy_pick_pod(namespace: Optional[str] = None) -> str:
-    load_kube_config()
-    core_v1 = client.CoreV1Api()
+    core_v1 = get_core_v1()
     if namespace is None:
         pods = core_v1.list_pod_for_all_namespaces()
     else:
@@ -84,15 +91,27 @@ def fuzzy_pick_pod(namespace: Optional[str] = None) -> str:
 
 
 def clone_pod(core_v1, namespace: str, source_pod_name: str):
-    source_pod = core_v1.read_namespaced_pod(name=source_pod_name, namespace=namespace)
-    container = source_pod.spec.containers[0]
-    breakpoint()
+    # Fetch the pod as a plain dict; skipping V1Pod model construction
+    # avoids the client's setattr-heavy deserialization, and the camelCase
+    # dicts pass through sanitize_for_serialization untouched when the new
+    # pod is created.
+    data = core_v1.api_client.call_api(
+        "/api/v1/namespaces/{namespace}/pods/{name}",
+        "GET",
+        path_params={"namespace": namespace, "name": source_pod_name},
+        header_params={"Accept": "application/json"},
+        auth_settings=["BearerToken"],
+        response_type=object,
+        _return_http_data_only=True,
+    )
+    spec = data["spec"]
+    container = spec["containers"][0]
     return (
-        container.image,
-        container.volume_mounts,
-        source_pod.spec.volumes,
-        container.env,
-        source_pod.spec.image_pull_secrets,
+        container["image"],
+        container.get("volumeMounts"),
+        spec.get("volumes"),
+        container.get("env"),
+        spec.get("imagePullSecrets"),
     )
 
 
@@ -153,8 +172,7 @@ def create(
     ),
 ):
     """Create a new Kubernetes pod inspired by distrobox."""
-    load_kube_config()
-    core_v1 = client.CoreV1Api()
+    core_v1 = get_core_v1()
 
     if fuzzy_clone:
         namespace, clone = fuzzy_pick_pod(namespace)
@@ -307,7 +325,6 @@ detect_package_manager_and_install_command() {
 def cli_fuzzy_pick_pod(
     namespace: str = typer.Option(None, help="Kubernetes namespace"),
 ):
-    load_kube_config()
     pod = fuzzy_pick_pod(namespace)
 
     if not pod: